@@ -1,14 +1,27 @@
 # Import required modules
 import os
+import sys
 import socket
+import select
 import time
 import logging
+import itertools
+import threading
 import configparser
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from astropy.io import fits
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.observers.api import BaseObserver
+from watchdog.observers.polling import PollingObserver
+from watchdog.events import PatternMatchingEventHandler
+
+# Prefer the fitsio C wrapper for header reads, astropy is the fallback
+try:
+    import fitsio
+except ImportError:
+    fitsio = None
+    from astropy.io import fits
 
 # Read configuration settings
 config = configparser.ConfigParser()
@@ -37,33 +50,123 @@ logging.basicConfig(
 SOCKET_PI_ADDRESS = config.get("Socket Settings", "pi_address")
 SOCKET_PORT = int(config.get("Socket Settings", "port"))
 FOLDER_TO_WATCH = config.get("Folder Settings", "folder_path")
+SOCKET_CONNECT_TIMEOUT = 5  # in sec
 
+# Used where the observer cannot report the writer closing a file
+WRITE_POLL_INTERVAL = 0.1  # in sec
+WRITE_TIMEOUT = 5  # in sec
 
-def send_azimuth(azimuth: Optional[float]) -> None:
+# FITS files are handled off the watchdog thread by a small worker pool
+MAX_WORKERS = 4
+MAX_PENDING_FILES = 16
+
+
+# Persistent connection to the Raspberry Pi, shared by the file watcher and the GUI
+_sock_lock = threading.Lock()
+_sock: Optional[socket.socket] = None
+
+
+def _is_alive(sock: socket.socket) -> bool:
     """
-    Send the azimuthal value to the Raspberry Pi over a socket connection.
+    Check that the Raspberry Pi has not closed its end of the socket.
+
+    The Pi never sends anything, so a readable socket means it closed or reset
+    the connection, and a send on it would be silently thrown away.
 
     Args:
-        azimuth (Optional[float]): The azimuthal value to send.
+        sock (socket.socket): The socket to check.
+
+    Returns:
+        bool: Whether the socket can still be used.
     """
     try:
-        # Create socket object
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        readable, _, _ = select.select([sock], [], [], 0)
+        if not readable:
+            return True
+        return sock.recv(1, socket.MSG_PEEK) != b""
+    except OSError:
+        return False
+
+
+def _ensure_connected() -> socket.socket:
+    """
+    Return the persistent socket to the Raspberry Pi, connecting if needed.
+
+    Returns:
+        socket.socket: The connected socket.
+    """
+    global _sock
+
+    if _sock is not None and not _is_alive(_sock):
+        logging.info("Raspberry Pi closed the connection, reconnecting")
+        _disconnect()
 
-        # Connect to the server
-        sock.connect((SOCKET_PI_ADDRESS, SOCKET_PORT))
+    if _sock is None:
+        # Bounded so an unreachable Pi cannot hold the lock (and the GUI) for long
+        sock = socket.create_connection(
+            (SOCKET_PI_ADDRESS, SOCKET_PORT), timeout=SOCKET_CONNECT_TIMEOUT
+        )
+        sock.settimeout(None)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        _sock = sock
 
-        # Send the message (azimuth value)
-        message = str(azimuth)
-        sock.send(message.encode("utf-8"))
+    return _sock
 
-        # Close the connection
-        sock.close()
+
+def _disconnect() -> None:
+    """
+    Close the persistent socket so the next send reconnects.
+    """
+    global _sock
+
+    if _sock is not None:
+        try:
+            _sock.close()
+        except OSError:
+            pass
+        _sock = None
+
+
+def _send(message: str) -> None:
+    """
+    Send a newline framed message to the Raspberry Pi over the persistent socket.
+
+    If the Raspberry Pi dropped the connection, reconnect and retry once.
+
+    Args:
+        message (str): The message to send, starting with its type token.
+    """
+    data = message.encode("utf-8") + b"\n"
+
+    try:
+        with _sock_lock:
+            for attempt in range(2):
+                try:
+                    _ensure_connected().sendall(data)
+                    return
+                except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+                    _disconnect()
+                    if attempt:
+                        raise
+                except OSError:
+                    _disconnect()
+                    raise
 
     except socket.error as e:
-        logging.error(f"Azimuth socket error: {e}")
+        logging.error(f"Socket error when sending {message!r}: {e}")
     except Exception as e:
-        logging.error(f"Exception error when sending azimuth: {e}")
+        logging.error(f"Exception error when sending {message!r}: {e}")
+
+
+def send_azimuth(azimuth: Optional[float]) -> None:
+    """
+    Send the azimuthal value to the Raspberry Pi over a socket connection.
+
+    Args:
+        azimuth (Optional[float]): The azimuthal value to send.
+    """
+    _send(f"AZ {azimuth}" if azimuth is not None else "STOP")
 
 
 def send_controls(control: Optional[str]) -> None:
@@ -73,63 +176,250 @@ def send_controls(control: Optional[str]) -> None:
     Args:
         control (Optional[str]): The control to send.
     """
-    try:
-        # Create socket object
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    _send(f"CTL {control}")
 
-        # Connect to the server
-        sock.connect((SOCKET_PI_ADDRESS, SOCKET_PORT))
 
-        # Send the message (control value)
-        message = str(control)
-        sock.send(message.encode("utf-8"))
+def read_centaz(path: str) -> Optional[float]:
+    """
+    Read the azimuthal value (CENTAZ) from the primary header of a FITS file.
 
-        # Close the connection
-        sock.close()
+    Args:
+        path (str): Path to the FITS file.
 
-    except socket.error as e:
-        logging.error(f"Control socket error: {e}")
+    Returns:
+        Optional[float]: The CENTAZ value, or None if the header lacks it.
+    """
+    # CENTAZ lives in the primary header, so never look past HDU 0
+    if fitsio is not None:
+        return fitsio.read_header(path, ext=0).get("CENTAZ")
+    return fits.getheader(path, ext=0, ignore_missing_end=True).get("CENTAZ")
+
+
+def wait_for_write(path: str) -> None:
+    """
+    Wait until a FITS file stops growing, for backends that never report closes.
+
+    Args:
+        path (str): Path to the FITS file.
+    """
+    deadline = time.monotonic() + WRITE_TIMEOUT
+    last_size = -1
+
+    while time.monotonic() < deadline:
+        size = os.path.getsize(path)
+        if size and size == last_size:
+            return
+        last_size = size
+        time.sleep(WRITE_POLL_INTERVAL)
+
+
+# Workers finish out of order, so each file gets a sequence number and results
+# older than the last one sent are dropped instead of rolling the dome back
+_sequence = itertools.count()
+_order_lock = threading.Lock()
+_last_sent = -1
+
+
+def process_fits(path: str, sequence: int, wait: bool = False) -> None:
+    """
+    Read the CENTAZ value from a FITS file and send it to the Pi.
+
+    Args:
+        path (str): Path to the FITS file.
+        sequence (int): The order in which the file was submitted.
+        wait (bool): Whether to wait for the file to stop growing first.
+    """
+    global _last_sent
+
+    try:
+        if wait:
+            wait_for_write(path)
+        centaz_value = read_centaz(path)
     except Exception as e:
-        logging.error(f"Exception error when sending control: {e}")
+        logging.error(f"Error reading FITS header: {e}")
+        return
+
+    with _order_lock:
+        if sequence < _last_sent:
+            logging.info(f"Skipping stale azimuth from {path}, a newer image was sent")
+            return
+        _last_sent = sequence
+        send_azimuth(centaz_value)
 
 
-class FITSEventHandler(FileSystemEventHandler):
+def _lower_priority() -> None:
+    """
+    Run a worker thread at the lowest priority so it never competes with image capture.
+    """
+    try:
+        os.nice(19)
+    except (AttributeError, OSError):
+        pass  # os.nice is not available on Windows
+
+
+_pool = ThreadPoolExecutor(
+    max_workers=MAX_WORKERS,
+    thread_name_prefix="fits",
+    initializer=_lower_priority,
+)
+_pending = threading.BoundedSemaphore(MAX_PENDING_FILES)
+
+
+def submit_fits(path: str, wait: bool = False) -> None:
+    """
+    Queue a FITS file for processing on the worker pool.
+
+    Blocks the caller while MAX_PENDING_FILES are already queued.
+
+    Args:
+        path (str): Path to the FITS file.
+        wait (bool): Whether to wait for the file to stop growing first.
+    """
+    _pending.acquire()
+    future = _pool.submit(process_fits, path, next(_sequence), wait)
+    future.add_done_callback(lambda _: _pending.release())
+
+
+class FITSEventHandler(PatternMatchingEventHandler):
     """
     Event handler for monitoring the FITS image folder and sending azimuthal data.
+
+    Only events for *.fits files reach the handler methods.
     """
 
+    def __init__(self, close_events: bool) -> None:
+        """
+        Initialize the event handler.
+
+        Args:
+            close_events (bool): Whether the observer reports the writer closing a file.
+        """
+        super().__init__(
+            patterns=["*.fits"], ignore_directories=True, case_sensitive=True
+        )
+        self.close_events = close_events
+
     def on_created(self, event) -> None:
         """
         Handler for the 'created' event.
 
+        Only used where the observer cannot report the writer closing the file.
+
         Args:
             event: The event object representing the file system event.
         """
-        if event.is_directory:
-            return
+        if not self.close_events:
+            submit_fits(event.src_path, wait=True)
 
-        # Check if the file is a FITS file
-        if os.path.splitext(event.src_path)[1] == ".fits":
-            time.sleep(2)  # Wait for the file to be fully written
+    def on_closed(self, event) -> None:
+        """
+        Handler for the 'closed' event, fired once the writer has closed the file.
 
-            # Open the FITS image
-            try:
-                header = fits.getheader(event.src_path)
-                centaz_value = header.get("CENTAZ")
-                send_azimuth(centaz_value)
-            except Exception as e:
-                logging.error(f"Error reading FITS header: {e}")
+        Args:
+            event: The event object representing the file system event.
+        """
+        submit_fits(event.src_path)
 
+    def on_moved(self, event) -> None:
+        """
+        Handler for the 'moved' event, for writers that rename a finished file into place.
 
-def main() -> None:
+        Args:
+            event: The event object representing the file system event.
+        """
+        # The pattern also matches a FITS file being renamed away
+        if event.dest_path.endswith(".fits"):
+            submit_fits(event.dest_path)
+
+
+def _native_observer() -> BaseObserver:
     """
-    Main function to start the file monitoring and event handling.
+    Create the kernel backed observer for this platform.
+
+    Returns:
+        BaseObserver: The observer to try first.
     """
-    event_handler = FITSEventHandler()
-    observer = Observer()
+    if sys.platform.startswith("linux"):
+        from watchdog.observers.inotify import InotifyObserver
+
+        # Full events report a file moved in from outside the folder as a move
+        # to its destination rather than as a creation that never closes
+        return InotifyObserver(generate_full_events=True)
+    if sys.platform == "darwin":
+        from watchdog.observers.fsevents import FSEventsObserver
+
+        return FSEventsObserver()
+    if sys.platform == "win32":
+        from watchdog.observers.read_directory_changes import WindowsApiObserver
+
+        return WindowsApiObserver()
+    return Observer()
+
+
+def _reports_closes(observer: BaseObserver) -> bool:
+    """
+    Check whether the observer reports the writer closing a file.
+
+    Only the inotify observer (Linux) does.
+
+    Args:
+        observer (BaseObserver): The observer to check.
+
+    Returns:
+        bool: Whether 'closed' events will be delivered.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        from watchdog.observers.inotify import InotifyObserver
+    except Exception:
+        return False
+    return isinstance(observer, InotifyObserver)
+
+
+def _start_observer(observer: BaseObserver) -> BaseObserver:
+    """
+    Schedule and start an observer on the FITS folder.
+
+    Args:
+        observer (BaseObserver): The observer to use.
+
+    Returns:
+        BaseObserver: The running observer.
+    """
+    event_handler = FITSEventHandler(_reports_closes(observer))
     observer.schedule(event_handler, FOLDER_TO_WATCH, recursive=False)
     observer.start()
 
+    logging.info(f"Watching {FOLDER_TO_WATCH} with {type(observer).__name__}")
+
+    return observer
+
+
+def start_observer() -> BaseObserver:
+    """
+    Start the native file system observer for this platform.
+
+    Falls back to polling if the native observer cannot be imported or started,
+    e.g. when the inotify instance or watch limits are exhausted.
+
+    Returns:
+        BaseObserver: The running observer.
+    """
+    try:
+        return _start_observer(_native_observer())
+    except Exception as e:
+        logging.warning(f"Native file system observer failed, polling instead: {e}")
+        return _start_observer(PollingObserver())
+
+
+def main() -> None:
+    """
+    Main function to start the file monitoring and event handling.
+    """
+    # The observer thread keeps forwarding azimuths after the window is closed
+    start_observer()
+
     root = tk.Tk()
 
     root.geometry("256x128")
@@ -1,9 +1,16 @@
 import RPi.GPIO as GPIO
+import os
+import sys
+import json
 import math
 import socket
+import selectors
 import time
+import atexit
+import signal
 import logging
-import multiprocessing
+import functools
+import threading
 import configparser
 import traceback
 import tkinter as tk
@@ -38,15 +45,68 @@ logging.basicConfig(
     ],
 )
 
+# * Read config values once at startup
+OPEN_TIME: int = int(config.get("Observatory Settings", "open_time"))  # * in sec
+CLOSE_TIME: int = int(config.get("Observatory Settings", "close_time"))  # * in sec
+HOME_ROTATION: int = int(
+    config.get("Observatory Settings", "home_rotation")
+)  # * in deg
+CONTROL_BOX_ROTATION: int = int(
+    config.get("Observatory Settings", "control_box_rotation")
+)  # * in deg
+DECEL_ANGLE: float = float(
+    config.get("Observatory Settings", "decel_angle")
+)  # * in deg
+SYNC_THRESHOLD: int = int(
+    config.get("Observatory Settings", "sync_threshold")
+)  # * in deg
+DIAMETER_MM: int = int(config.get("Observatory Settings", "diameter_mm"))  # * in mm
+
+CLK_PIN: RPiPinType = int(config.get("Encoder Settings", "clk_pin"))
+DT_PIN: RPiPinType = int(config.get("Encoder Settings", "dt_pin"))
+RESOLUTION: int = int(config.get("Encoder Settings", "resolution"))
+WHEEL_CIRCUMFERENCE_MM: int = int(
+    config.get("Encoder Settings", "wheel_circumference_mm")
+)
+
+CCW_PIN: RPiPinType = int(config.get("Relay Settings", "ccw_pin"))
+CW_PIN: RPiPinType = int(config.get("Relay Settings", "cw_pin"))
+CLOSE_PIN: RPiPinType = int(config.get("Relay Settings", "close_pin"))
+OPEN_PIN: RPiPinType = int(config.get("Relay Settings", "open_pin"))
+
+SOCKET_PORT: int = int(config.get("Socket Settings", "port"))
+DIE_COUNTER_SEC: float = float(config.get("Socket Settings", "die_counter")) * 60
+MAX_MESSAGE_BYTES: int = 4096  # * longest line accepted from the control computer
+
+# * Serializes _atomic_write, the flush thread and shutdown may write the same file at once
+_write_lock: threading.Lock = threading.Lock()
+
+
+def _atomic_write(path: str, text: str) -> None:
+    """
+    Write text to a file atomically so a crash never leaves it half written.
+
+    Args:
+        path (str): The file to write.
+        text (str): The contents to write.
+    """
+    tmp_path = f"{path}.tmp"
+    with _write_lock:
+        with open(tmp_path, "w") as tmp_file:
+            tmp_file.write(text)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, path)
+
 
 # * Class for the 4 channel relay that controls the rotation and shutter motors
 class Relay:
     def __init__(self) -> None:
         self.pins: Dict[str, RPiPinType] = {
-            "ccw": int(config.get("Relay Settings", "ccw_pin")),
-            "cw": int(config.get("Relay Settings", "cw_pin")),
-            "close": int(config.get("Relay Settings", "close_pin")),
-            "open": int(config.get("Relay Settings", "open_pin")),
+            "ccw": CCW_PIN,
+            "cw": CW_PIN,
+            "close": CLOSE_PIN,
+            "open": OPEN_PIN,
         }
 
         for key, value in self.pins.items():
@@ -55,12 +115,6 @@ class Relay:
 
         logging.info("relay created")
 
-    def __del__(self) -> None:
-        """
-        Clean up GPIO resources when the Relay object is destroyed.
-        """
-        GPIO.cleanup()
-
 
 # * Class for the rotary encoder that will measure rotation of the observatory dome
 class Encoder:
@@ -68,131 +122,136 @@ class Encoder:
         self.dome_diameter: int = dome_diameter
 
         self.pins: Dict[str, RPiPinType] = {
-            "clk": int(config.get("Encoder Settings", "clk_pin")),
-            "dt": int(config.get("Encoder Settings", "dt_pin")),
+            "clk": CLK_PIN,
+            "dt": DT_PIN,
         }
 
         for key, value in self.pins.items():
             GPIO.setup(value, GPIO.IN)
 
-        self.is_measuring: multiprocessing.Value = multiprocessing.Value(
-            "i", 0
-        )  # * this makes the value shared across different processes
-        self.is_home: multiprocessing.Value = multiprocessing.Value(
-            "i", 1
-        )  # * this makes the value shared across different processes
-
-        self.resolution: int = int(config.get("Encoder Settings", "resolution"))
-        self.wheel_circumference_mm: int = int(
-            config.get("Encoder Settings", "wheel_circumference_mm")
-        )
+        self.is_measuring: threading.Event = threading.Event()
+        self.is_home: threading.Event = threading.Event()
+        self.is_home.set()
+
+        self.resolution: int = RESOLUTION
+        self.wheel_circumference_mm: int = WHEEL_CIRCUMFERENCE_MM
         try:
             with open("dome_rotation.txt", "r") as dome_rotation:
-                self.counter: multiprocessing.Value = multiprocessing.Value(
-                    "i", int(dome_rotation.read().decode("utf-8"))
-                )
+                self.counter: CounterType = int(dome_rotation.read().strip())
         except Exception as e:
             logging.error(f"Error reading dome_rotation.txt: {e}")
-            self.counter: multiprocessing.Value = multiprocessing.Value(
-                "i",
-                int(
-                    int(config.get("Observatory Settings", "home_rotation"))
-                    / 360
-                    * (math.pi * self.dome_diameter)
-                    / self.wheel_circumference_mm
-                    * self.resolution
-                ),
-            )  # * this makes the value shared across different processes
-        self.clk_last_state: multiprocessing.Value = multiprocessing.Value(
-            "i", GPIO.input(self.pins["clk"])
-        )  # * this makes the value shared across different processes
+            self.counter: CounterType = int(
+                HOME_ROTATION
+                / 360
+                * (math.pi * self.dome_diameter)
+                / self.wheel_circumference_mm
+                * self.resolution
+            )
+        # * counter and clk_last_state are only written by the edge callback
+        self.clk_last_state: GPIOValueType = GPIO.input(self.pins["clk"])
+        self.flush_interval: float = 1.0  # * in sec, between rotation file writes
+        self.tick_event: threading.Event = (
+            threading.Event()
+        )  # * set on every click so waiters wake up as soon as the dome moves
+
+        atexit.register(self.__write_rotation)
 
         logging.info("encoder created")
 
-    def __read_from_encoder(self) -> None:
+    def __write_rotation(self) -> None:
         """
-        Read encoder values and update the counter value.
+        Persist the counter value to dome_rotation.txt.
         """
         try:
-            dome_rotation = open("dome_rotation.txt", "w")
-            while self.is_measuring.value:
-                time.sleep(
-                    0.0005
-                )  # * sleeping for performance. Speed of dome is 690 clicks / 5.2 degrees per second. So, we only need to loop encoder reading every 1.4ms. Loopoing every 0.5ms for headroom.
-                clk_state: GPIOValueType = GPIO.input(self.pins["clk"])
-                dt_state: GPIOValueType = GPIO.input(self.pins["dt"])
-
-                if clk_state != self.clk_last_state.value:
-                    if dt_state != clk_state:
-                        self.counter.value -= 1
-                    else:
-                        self.counter.value += 1
-                    self.clk_last_state.value = clk_state
-                    dome_rotation.seek(0)
-                    dome_rotation.write(str(self.counter.value))
-                    dome_rotation.flush()
-
+            _atomic_write("dome_rotation.txt", str(self.counter))
         except Exception as e:
-            logging.error(f"exception error at encoder: {e}")
-        finally:
-            dome_rotation.close()
+            logging.error(f"Error writing dome_rotation.txt: {e}")
+
+    def __flush_rotation(self) -> None:
+        """
+        Persist the counter value once per flush interval while the dome moves.
+        """
+        last_written: CounterType = self.counter
+        while self.is_measuring.is_set():
+            time.sleep(self.flush_interval)
+            if self.counter != last_written:
+                last_written = self.counter
+                self.__write_rotation()
+
+    def __on_clk_edge(self, channel: RPiPinType) -> None:
+        """
+        Decode a quadrature transition and update the counter value.
+
+        Called by RPi.GPIO from its event thread on every edge of the clk pin.
+
+        Args:
+            channel (RPiPinType): The pin that triggered the callback.
+        """
+        clk_state: GPIOValueType = GPIO.input(self.pins["clk"])
+
+        if clk_state != self.clk_last_state:
+            dt_state: GPIOValueType = GPIO.input(self.pins["dt"])
+            # * quadrature decode: dt matching clk means cw, anything else ccw
+            self.counter += 1 if dt_state == clk_state else -1
+            self.clk_last_state = clk_state
+            self.tick_event.set()
 
     def toggle_measure(self) -> None:
         """
         Toggle the measurement of encoder values.
         """
-        self.is_measuring.value = not self.is_measuring.value
+        if not self.is_measuring.is_set():
+            self.is_measuring.set()
 
-        if self.is_measuring.value:
-            process = multiprocessing.Process(target=self.__read_from_encoder)
-            process.start()
+            # * edge interrupts instead of polling, python only wakes up when the dome actually moves
+            GPIO.add_event_detect(
+                self.pins["clk"], GPIO.BOTH, callback=self.__on_clk_edge
+            )
+            threading.Thread(target=self.__flush_rotation, daemon=True).start()
 
             logging.info("beginning reading from encoder")
         else:
-            logging.info("stopped reading from encoder")
+            self.is_measuring.clear()
+            GPIO.remove_event_detect(self.pins["clk"])
+            self.__write_rotation()
 
-    def __del__(self) -> None:
-        """
-        Clean up GPIO resources when the Encoder object is destroyed.
-        """
-        GPIO.cleanup()
+            logging.info("stopped reading from encoder")
 
 
 # * Class for the observatory itself where control functions are centralized
 class Observatory:
     def __init__(self) -> None:
         try:
-            with open("shutter_status.txt", "rb") as shutter_status:
-                self.is_shutter_open: bool = bool(shutter_status.read().decode("utf-8"))
+            with open("shutter_status.txt", "r") as shutter_status:
+                status: str = shutter_status.read().strip()
+            if status.startswith("{"):
+                self.is_shutter_open: bool = json.loads(status)["open"]
+            else:
+                self.is_shutter_open: bool = (
+                    status == "True"
+                )  # * older versions wrote a bare True/False
         except Exception as e:
             logging.error(f"Error reading shutter_status.txt: {e}")
             self.is_shutter_open: bool = False
 
-        self.open_time: int = int(
-            config.get("Observatory Settings", "open_time")
-        )  # * in sec
-        self.close_time: int = int(
-            config.get("Observatory Settings", "close_time")
-        )  # * in sec
-        self.control_box_rotation: int = int(
-            config.get("Observatory Settings", "control_box_rotation")
-        )  # * in deg
-        self.decel_angle: float = float(
-            config.get("Observatory Settings", "decel_angle")
-        )  # * in deg
+        self.open_time: int = OPEN_TIME  # * in sec
+        self.close_time: int = CLOSE_TIME  # * in sec
+        self.control_box_rotation: int = CONTROL_BOX_ROTATION  # * in deg
+        self.decel_angle: float = DECEL_ANGLE  # * in deg
         self.target_rotation: RotationType = 0.0  # * in deg
-        self.sync_threshold: int = int(
-            config.get("Observatory Settings", "sync_threshold")
-        )  # * in deg
-        self.diameter: int = int(
-            config.get("Observatory Settings", "diameter_mm")
-        )  # * in mm
+        self.sync_threshold: int = SYNC_THRESHOLD  # * in deg
+        self.diameter: int = DIAMETER_MM  # * in mm
 
         GPIO.setmode(GPIO.BCM)
         GPIO.setwarnings(False)
 
         self.relay: Relay = Relay()
         self.encoder: Encoder = Encoder(self.diameter)
+        self._deg_per_click: RotationType = (
+            360.0
+            * self.encoder.wheel_circumference_mm
+            / (self.encoder.resolution * math.pi * self.diameter)
+        )  # * precomputed so converting clicks to degrees is a single multiply
 
         self.operations: Dict[str, str] = {
             "rotate_ccw": "ccw",
@@ -200,7 +259,11 @@ class Observatory:
             "close": "close",
             "open": "open",
         }
-        self.statuses: Dict[str, bool] = {"start": True, "stop": False}
+        self._op_pins: Dict[str, RPiPinType] = {
+            operation: self.relay.pins[key]
+            for operation, key in self.operations.items()
+        }  # * resolved once so operate does a single lookup
+        self.statuses: Dict[str, GPIOValueType] = {"start": GPIO.HIGH, "stop": GPIO.LOW}
         self.open_logic: Dict[bool, int] = {
             True: self.close_time,
             False: self.open_time,
@@ -208,7 +271,7 @@ class Observatory:
 
         self.important_values: Dict[str, Union[bool, CounterType]] = {
             "shutter_state": self.is_shutter_open,
-            "encoder_count": self.encoder.counter.value,
+            "encoder_count": self.encoder.counter,
         }
 
         logging.info("observatory created")
@@ -223,28 +286,16 @@ class Observatory:
         """
         try:
             if status is not None:
-                GPIO.output(
-                    int(self.relay.pins[self.operations.get(operation)]),
-                    self.statuses.get(status),
-                )
+                GPIO.output(self._op_pins[operation], self.statuses[status])
             else:
-                with open("shutter_status.txt", "w") as shutter_status:
-                    GPIO.output(
-                        int(self.relay.pins[self.operations.get(operation)]), GPIO.HIGH
-                    )
-                    if self.is_shutter_open:
-                        time.sleep(self.open_logic.get(self.is_shutter_open))
-                        self.is_shutter_open = not self.is_shutter_open
-                        shutter_status.write(
-                            str(self.is_shutter_open)
-                        )  # * writes False
-                    else:
-                        time.sleep(self.open_logic.get(self.is_shutter_open))
-                        self.is_shutter_open = not self.is_shutter_open
-                        shutter_status.write(str(self.is_shutter_open))  # * writes True
-                    GPIO.output(
-                        int(self.relay.pins[self.operations.get(operation)]), GPIO.LOW
-                    )
+                pin: RPiPinType = self._op_pins[operation]
+                GPIO.output(pin, GPIO.HIGH)
+                time.sleep(self.open_logic.get(self.is_shutter_open))
+                self.is_shutter_open = not self.is_shutter_open
+                GPIO.output(pin, GPIO.LOW)
+                _atomic_write(
+                    "shutter_status.txt", json.dumps({"open": self.is_shutter_open})
+                )
 
         except Exception as e:
             logging.error(f"exception error at operate: {e}")
@@ -259,13 +310,7 @@ class Observatory:
         Returns:
             RotationType: The rotation in degrees.
         """
-        return (
-            clicks
-            / self.encoder.resolution
-            * self.encoder.wheel_circumference_mm
-            / (math.pi * self.dome_diameter)
-            * 360
-        )
+        return clicks * self._deg_per_click
 
     def _sync(self, dir: str, edge: bool) -> None:
         """
@@ -277,58 +322,44 @@ class Observatory:
         """
         self.operate(f"rotate_{dir}", "start")
 
+        # * hoisted out of the polling loops, the dome spends seconds in them
+        encoder = self.encoder
+        deg_per_click: RotationType = self._deg_per_click
+        target_low: RotationType = self.target_rotation - self.decel_angle
+        target_high: RotationType = self.target_rotation + self.decel_angle
+
         if not edge:
             if dir in ("cw",):
-                while (
-                    self._normalize_to_360(
-                        self._clicks_to_degrees(self.encoder.counter.value)
-                    )
-                    < self.target_rotation - self.decel_angle
-                ):
-                    print(
-                        f"Shutter rotation: {self._normalize_to_360(self._clicks_to_degrees(self.encoder.counter.value))}"
-                    )
-                    print(f"Target rotation: {self.target_rotation - self.decel_angle}")
-                    time.sleep(0.1)
+                last_log: float = 0.0
+                while (shutter := (encoder.counter * deg_per_click) % 360) < target_low:
+                    now = time.monotonic()
+                    if now - last_log > 1.0:  # * at most once per sec
+                        logging.debug(
+                            f"shutter rotation: {shutter:.2f}, target rotation: {target_low:.2f}"
+                        )
+                        last_log = now
+                    self.__wait_for_tick()
             else:
-                while (
-                    self._normalize_to_360(
-                        self._clicks_to_degrees(self.encoder.counter.value)
-                    )
-                    > self.target_rotation + self.decel_angle
-                ):
-                    time.sleep(0.1)
+                while (encoder.counter * deg_per_click) % 360 > target_high:
+                    self.__wait_for_tick()
         else:
             if dir in ("cw",) and edge:
-                while (
-                    self._normalize_to_360(
-                        self._clicks_to_degrees(self.encoder.counter.value)
-                    )
-                    + 180
-                ) % 360 < (self.target_rotation - self.decel_angle + 180) % 360:
-                    time.sleep(0.1)
+                target_low_moved: RotationType = (target_low + 180) % 360
+                while (encoder.counter * deg_per_click + 180) % 360 < target_low_moved:
+                    self.__wait_for_tick()
             else:
-                while (
-                    self._normalize_to_360(
-                        self._clicks_to_degrees(self.encoder.counter.value)
-                    )
-                    + 180
-                ) % 360 > (self.target_rotation + self.decel_angle + 180) % 360:
-                    time.sleep(0.1)
+                target_high_moved: RotationType = (target_high + 180) % 360
+                while (encoder.counter * deg_per_click + 180) % 360 > target_high_moved:
+                    self.__wait_for_tick()
 
         self.operate(f"rotate_{dir}", "stop")
 
-    def _normalize_to_360(self, value: RotationType) -> RotationType:
+    def __wait_for_tick(self) -> None:
         """
-        Normalize an angle value to the range [0, 360) degrees.
-
-        Args:
-            value (RotationType): The angle value to normalize.
-
-        Returns:
-            RotationType: The normalized angle value.
+        Block until the encoder reports a click, or 0.1 sec at most.
         """
-        return (value + 360) % 360
+        self.encoder.tick_event.wait(timeout=0.1)
+        self.encoder.tick_event.clear()
 
     def check_for_sync(
         self, target_rotation_from_socket: RotationType, force_sync: bool
@@ -343,17 +374,16 @@ class Observatory:
         self.target_rotation = target_rotation_from_socket
 
         target: RotationType = self.target_rotation
-        shutter: RotationType = self._normalize_to_360(
-            self._clicks_to_degrees(self.encoder.counter.value)
-        )
+        shutter: RotationType = self._clicks_to_degrees(self.encoder.counter) % 360
 
         if not force_sync:
             threshold: int = self.sync_threshold
         else:
             threshold: int = 0
 
-        low_threshold: RotationType = self._normalize_to_360(target - threshold)
-        high_threshold: RotationType = self._normalize_to_360(target + threshold)
+        # * python's % is already non-negative for a positive modulus
+        low_threshold: RotationType = (target - threshold) % 360
+        high_threshold: RotationType = (target + threshold) % 360
 
         if abs(high_threshold - target) == threshold == abs(target - low_threshold):
             if not low_threshold <= shutter <= high_threshold:
@@ -377,122 +407,228 @@ class Observatory:
         """
         self.operate("close")  # * Close shutter
 
-        self.check_for_sync(
-            int(config.get("Observatory Settings", "home_rotation")), True
-        )  # * Rotate back to home position
+        self.check_for_sync(HOME_ROTATION, True)  # * Rotate back to home position
 
 
 # * Class for the socket that receives azimuthal rotation data from the control computer and calls observatory to sync with target
 class Socket:
     def __init__(self) -> None:
         self.host: str = "0.0.0.0"
-        self.port: int = int(config.get("Socket Settings", "port"))
-        self.die_counter: multiprocessing.Value = multiprocessing.Value(
-            "f", float(config.get("Socket Settings", "die_counter")) * 60
-        )
-
-        self.is_listening: multiprocessing.Value = multiprocessing.Value(
-            "i", 0
-        )  # * this makes the value shared across different processes
-        self.can_die: multiprocessing.Value = multiprocessing.Value(
-            "i", 0
-        )  # * this makes the value shared across different processes
-        self.data: multiprocessing.Value = multiprocessing.Value(
-            "f", 0
-        )  # * this makes the value shared across different processes
+        self.port: int = SOCKET_PORT
+        self.die_counter: float = DIE_COUNTER_SEC  # * in sec
+        self.die_lock: threading.Lock = (
+            threading.Lock()
+        )  # * the socket and timeout threads both write die_counter
+
+        self.is_listening: threading.Event = threading.Event()
+        self.can_die: threading.Event = threading.Event()
+        self.data: RotationType = 0.0
 
         self.observatory: Observatory = Observatory()
 
+    def __handle_message(self, message: str) -> None:
+        """
+        Handle a single message received from the control computer.
+
+        Args:
+            message (str): The decoded message, without its newline delimiter.
+        """
+        with self.die_lock:
+            self.die_counter = DIE_COUNTER_SEC
+        if not self.can_die.is_set():
+            self.toggle_death()
+
+        # * messages are "AZ <azimuth>", "CTL <control>" or "STOP" for an image without CENTAZ
+        kind, _, payload = message.partition(" ")
+
+        if kind == "AZ":
+            try:
+                self.data = float(payload)
+            except ValueError:
+                logging.warning(f"ignoring malformed azimuth: {payload!r}")
+                return
+            self.observatory.check_for_sync(self.data, False)
+        elif kind == "CTL":
+            if payload == "toggle":
+                self.observatory.operate("close")
+            elif payload == "abort":
+                self.observatory.return_home()
+            else:
+                logging.warning(f"ignoring unknown control: {payload!r}")
+        elif kind == "STOP":
+            logging.warning("control computer sent an image without CENTAZ")
+        else:
+            logging.warning(f"ignoring malformed socket message: {message!r}")
+
+    def __accept(self, sel: selectors.BaseSelector, server: socket.socket) -> None:
+        """
+        Accept a connection from the control computer and watch it for messages.
+
+        Args:
+            sel (selectors.BaseSelector): The selector driving the socket loop.
+            server (socket.socket): The listening socket.
+        """
+        try:
+            conn, addr = server.accept()
+        except OSError as e:
+            # * spurious readiness, an aborted handshake or running out of fds
+            logging.warning(f"could not accept control computer connection: {e}")
+            return
+        conn.setblocking(False)
+        # * each connection keeps its own buffer of not yet delimited bytes
+        sel.register(conn, selectors.EVENT_READ, data=bytearray())
+
+        logging.info(f"control computer connected from {addr[0]}")
+
+    def __read(
+        self, sel: selectors.BaseSelector, conn: socket.socket, buffer: bytearray
+    ) -> None:
+        """
+        Drain a connection and handle every complete newline framed message.
+
+        Args:
+            sel (selectors.BaseSelector): The selector driving the socket loop.
+            conn (socket.socket): The readable connection.
+            buffer (bytearray): Bytes received on this connection but not yet handled.
+        """
+        try:
+            chunk = conn.recv(1024)
+        except OSError as e:
+            logging.warning(f"control computer connection lost: {e}")
+            chunk = b""
+
+        if not chunk:
+            sel.unregister(conn)
+            conn.close()
+            return
+
+        buffer += chunk
+        while (newline := buffer.find(b"\n")) != -1:
+            message = buffer[:newline].decode("utf-8", errors="replace").strip()
+            del buffer[: newline + 1]
+            if not message:
+                continue
+            try:
+                self.__handle_message(message)
+            except Exception as e:
+                logging.error(
+                    f"exception error handling {message!r}: {e}\n{traceback.format_exc()}"
+                )
+
+        if len(buffer) > MAX_MESSAGE_BYTES:
+            logging.warning(
+                f"dropping control computer connection, no newline in {len(buffer)} bytes"
+            )
+            sel.unregister(conn)
+            conn.close()
+
     def __read_from_socket(self) -> None:
         """
         Read data from the socket and update the observatory rotation.
         """
+        sel = selectors.DefaultSelector()
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sel.register(s, selectors.EVENT_READ, data=None)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             s.bind((self.host, self.port))
             s.listen(5)
+            s.setblocking(False)
 
-            while self.is_listening.value:
-                conn, addr = s.accept()
-                data = conn.recv(1024)
-                if not data:
-                    continue
-                if not self.can_die.value:
-                    self.can_die.value = not self.can_die.value
-                self.die_counter.value = (
-                    float(config.get("Socket Settings", "die_counter")) * 60
-                )
-
-                if self.data.decode("utf-8") == "toggle":
-                    self.observatory.operate("close")
-                elif self.data.decode("utf-8") == "abort":
-                    self.observatory.return_home()
-                else:
-                    self.data.value = float(data.decode("utf-8"))
-                    self.observatory.check_for_sync(self.data.value, False)
+            while self.is_listening.is_set():
+                for key, mask in sel.select(timeout=1):
+                    if key.data is None:
+                        self.__accept(sel, key.fileobj)
+                    else:
+                        self.__read(sel, key.fileobj, key.data)
 
         except socket.error as e:
             logging.error(f"socket error: {e}")
         except Exception as e:
             logging.error(f"exception error at socket: {e}\n{traceback.format_exc()}")
         finally:
-            s.close()
+            for key in list(sel.get_map().values()):
+                key.fileobj.close()
+            sel.close()
 
     def __death_count(self) -> None:
         """
         Count down the time until the observatory returns to the home position.
         """
-        while self.can_die.value:
+        while self.can_die.is_set():
             time.sleep(1)
-            if self.observatory.encoder.is_home:
+            if self.observatory.encoder.is_home.is_set():
                 continue
-            self.die_counter.value -= 1
+            with self.die_lock:
+                self.die_counter -= 1
+                die_counter: float = self.die_counter
 
-            if self.die_counter.value >= 300:
-                if self.die_counter.value % 300 == 0:
+            if die_counter >= 300:
+                if die_counter % 300 == 0:
                     logging.warning(
-                        f"dome automatically shutting down in {self.die_counter.value} seconds"
+                        f"dome automatically shutting down in {die_counter} seconds"
                     )
-            elif self.die_counter.value >= 30:
-                if self.die_counter.value % 30 == 0:
+            elif die_counter >= 30:
+                if die_counter % 30 == 0:
                     logging.warning(
-                        f"dome automatically shutting down in {self.die_counter.value} seconds"
+                        f"dome automatically shutting down in {die_counter} seconds"
                     )
             else:
                 logging.warning(
-                    f"dome automatically shutting down in {self.die_counter.value} seconds"
+                    f"dome automatically shutting down in {die_counter} seconds"
                 )
 
-            if self.die_counter.value < 0:
+            if die_counter < 0:
                 self.observatory.return_home()
-                self.can_die.value = False
-                self.die_counter.value = (
-                    float(config.get("Socket Settings", "die_counter")) * 60
-                )
+                self.can_die.clear()
+                with self.die_lock:
+                    self.die_counter = DIE_COUNTER_SEC
 
     def toggle_read(self) -> None:
         """
         Toggle reading data from the socket.
         """
-        self.is_listening.value = not self.is_listening.value
-
-        if self.is_listening.value:
-            process = multiprocessing.Process(target=self.__read_from_socket)
-            process.start()
+        if not self.is_listening.is_set():
+            self.is_listening.set()
+            threading.Thread(target=self.__read_from_socket, daemon=True).start()
 
             logging.info("begin reading socket")
+        else:
+            self.is_listening.clear()
 
     def toggle_death(self) -> None:
         """
         Toggle the death counter for returning to the home position.
         """
-        self.can_die.value = not self.can_die.value
-
-        if self.can_die.value:
-            process = multiprocessing.Process(target=self.__death_count)
-            process.start()
+        if not self.can_die.is_set():
+            self.can_die.set()
+            threading.Thread(target=self.__death_count, daemon=True).start()
 
             logging.info("begin timeout counter")
+        else:
+            self.can_die.clear()
+
+
+# * Signal handler
+def shutdown_gracefully(observatory_socket: "Socket", signum: int, frame) -> None:
+    """
+    Stop the workers, release the GPIO pins once and exit.
+
+    Args:
+        observatory_socket (Socket): The running Socket instance.
+        signum (int): The received signal number.
+        frame: The interrupted stack frame.
+    """
+    logging.info(f"received signal {signum}, shutting down")
+
+    # * clear every worker flag so no loop outlives the main thread
+    if observatory_socket.observatory.encoder.is_measuring.is_set():
+        observatory_socket.observatory.encoder.toggle_measure()  # * persists rotation
+    observatory_socket.is_listening.clear()
+    observatory_socket.can_die.clear()
+
+    GPIO.cleanup()
+    sys.exit(0)
 
 
 # * Main function
@@ -506,6 +642,9 @@ def main() -> None:
     socket.toggle_death()
     socket.observatory.encoder.toggle_measure()
 
+    signal.signal(signal.SIGTERM, functools.partial(shutdown_gracefully, socket))
+    signal.signal(signal.SIGINT, functools.partial(shutdown_gracefully, socket))
+
 
 if __name__ == "__main__":
     main()